@@ -4,37 +4,503 @@ Analyze only GitHub issues labeled as 'bug' from MentraOS
 """
 
 import json
+import multiprocessing
+import os
+import pickle
 import re
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from itertools import islice
 import sys
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def load_bug_issues(issues_dir):
-    """Load only issues with 'bug' label."""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Category and model patterns are compiled once at import rather than on
+# every re.search() call inside the per-issue loops. check_matchers.py checks
+# the keyword scans below against a plain re.search() of these patterns.
+_RAW_CATEGORY_PATTERNS = {
+    'bluetooth_pairing': [
+        r'\bpair\w*\b', r'\bbluetooth\b', r'\bble\b.*\bconnect\b', r'\bdisconnect\b', 
+        r'\bglasses\b.*\bpair\b', r'\bpairing\b'
+    ],
+    'translation_language': [
+        r'\btranslat\w+\b', r'\blanguage\b', r'\bwelsh\b', r'\bchinese\b', 
+        r'\benglish\b', r'\bhang\w*\b.*\btranslat\w+\b', r'\bspeech\b.*\bprocess\w*\b'
+    ],
+    'streaming_media': [
+        r'\bstream\w*\b', r'\brtmp\b', r'\blive\b.*\bstream\b', r'\bvideo\b.*\bstream\b', 
+        r'\brecord\w*\b.*\bstream\b', r'\bmedia\b.*\bstream\b'
+    ],
+    'permissions_android': [
+        r'\bpermission\w*\b', r'\bandroid\b.*\bpermission\b', r'\bmicrophone\b.*\bpermission\b', 
+        r'\blocation\b.*\bpermission\b', r'\bnotification\w*\b.*\bpermission\b'
+    ],
+    'ios_specific': [
+        r'\bios\b', r'\biphone\b', r'\bmic\b.*\bios\b', r'\bapple\b',
+        r'\bios\b.*\bfail\w*\b', r'\bios\b.*\bcrash\b'
+    ],
+    'app_crashes': [
+        r'\bcrash\w*\b', r'\bexception\b', r'\bfail\w*\b.*\bapp\b', 
+        r'\bclose\w*\b.*\bapp\b', r'\bhang\w*\b', r'\bfreez\w*\b', r'\bsoftexception\b'
+    ],
+    'ui_navigation': [
+        r'\bpage\b', r'\bnavigat\w*\b', r'\bui\b', r'\bmenu\b', 
+        r'\bbutton\b', r'\bsettings\b.*\breset\b', r'\bscreen\b.*\bblank\b'
+    ],
+    'cloud_sync': [
+        r'\bcloud\b', r'\bsync\b', r'\bserver\b', r'\bapi\b', 
+        r'\bwebsocket\b', r'\bdatabase\b', r'\bclient\b.*\bserver\b'
+    ],
+    'hardware_integration': [
+        r'\bhardware\b', r'\bsensor\w*\b', r'\bcalibrat\w*\b', 
+        r'\bfirmware\b', r'\bglasses\b.*\bstop\b'
+    ],
+    'performance': [
+        r'\bslow\b', r'\bperformance\b', r'\btimeout\b', 
+        r'\bmemory\b', r'\bbattery\b', r'\blag\w*\b', r'\bunreliable\b'
+    ],
+    'wifi_connectivity': [
+        r'\bwifi\b', r'\bhotspot\b', r'\bpassword\b.*\bwifi\b', 
+        r'\bnetwork\b.*\bconnect\b', r'\bwifi\b.*\bconnect\b'
+    ],
+    'developer_console': [
+        r'\bdev\b.*\bconsole\b', r'\bupload\b.*\bimage\b', r'\bicon\b.*\bupload\b',
+        r'\bdeveloper\b.*\bconsole\b', r'\bauth\w*\b.*\bconsole\b'
+    ],
+    'error_handling': [
+        r'\berror\b.*\bmessage\b', r'\bfeedback\b.*\bmissing\b', r'\bretry\b.*\binfinite\b',
+        r'\bwebview\b.*\berror\b', r'\berror\b.*\bhandling\b'
+    ],
+    'audio_processing': [
+        r'\baudio\b', r'\bmicrophone\b', r'\bmic\b', r'\bspeech\b', 
+        r'\bplayback\b', r'\bsound\b', r'\bvoice\b'
+    ],
+    'gallery_media': [
+        r'\bgallery\b', r'\bmedia\b.*\btransfer\b', r'\bphoto\b.*\bsync\b',
+        r'\bgallery\b.*\bsync\b', r'\bmedia\b.*\bgallery\b'
+    ],
+    'state_synchronization': [
+        r'\bstate\b.*\bsync\b', r'\bclient\b.*\bcloud\b.*\bstate\b', 
+        r'\bapp\b.*\bstate\b', r'\bboot\b.*\bscreen\b.*\bdeleted\b'
+    ],
+    'ble_communication': [
+        r'\bble\b', r'\bphoto\b.*\brequest\b', r'\back\b.*\bissue\b',
+        r'\bble\b.*\btransfer\b', r'\bble\b.*\bcrash\b'
+    ],
+    'camera_functionality': [
+        r'\bcamera\b', r'\brotation\b.*\bhardcoded\b', r'\bphoto\b.*\btaking\b',
+        r'\brecord\w*\b', r'\bcamera\b.*\brotation\b'
+    ]
+}
+
+_RAW_MODEL_PATTERNS = {
+    'even_realities_g1': [r'\bg1\b', r'\beven\b.*\brealities\b', r'\bg1\b.*\bglasses\b'],
+    'mentra_live': [r'\bmentra\b.*\blive\b', r'\blive\b'],
+    'mentra_mach1': [r'\bmach\s*1\b', r'\bmentra\b.*\bmach\b'],
+    'vuzix_z100': [r'\bvuzix\b', r'\bz100\b', r'\bz\s*100\b']
+}
+
+_CATEGORY_NAMES = list(_RAW_CATEGORY_PATTERNS)
+
+# Nearly every category pattern is a chain of word terms joined by .*, where
+# a term is an exact word (\bble\b) or a word prefix (\bpair\w*\b). When
+# pyahocorasick is installed, all term stems go into one automaton and the
+# text is scanned once for every term; a pattern then needs only a set lookup
+# per term, with its regex run only to confirm multi-term ordering. Without
+# it, terms are looked up in the issue's precomputed word set instead.
+_NON_WORD_RE = re.compile(r'\W+')
+_WORD_RE = re.compile(r'\w+')
+_TERM_RE = re.compile(r'\\b(\w+)(\\w[*+])?\\b')
+
+
+def _split_terms(pattern):
+    """Split a pattern into (stem, suffix) terms, or None if it has other syntax."""
+    terms = []
+    for part in pattern.split('.*'):
+        match = _TERM_RE.fullmatch(part)
+        if not match:
+            return None
+        terms.append((match.group(1), match.group(2) or ''))
+    return tuple(terms)
+
+
+def _keyword_patterns(raw_patterns):
+    """Build per-category (terms, confirming regex) entries for the keyword scan."""
+    keyword_patterns = {}
+    for category, pattern_list in raw_patterns.items():
+        entries = []
+        for pattern in pattern_list:
+            terms = _split_terms(pattern)
+            if terms is None:
+                # No term prefilter; always fall through to the regex
+                entries.append(((), re.compile(pattern)))
+            elif len(terms) == 1:
+                entries.append((terms, None))
+            else:
+                entries.append((terms, re.compile(pattern)))
+        keyword_patterns[category] = entries
+    return keyword_patterns
+
+
+def _keyword_automaton():
+    """Build an Aho-Corasick automaton over every category term."""
+    keys = defaultdict(set)
+    for entries in _KEYWORD_PATTERNS.values():
+        for terms, _ in entries:
+            for stem, suffix in terms:
+                # Text is scanned with non-word runs collapsed to single
+                # spaces, so a leading space is \b and a trailing one ends
+                # an exact word.
+                key = f' {stem}' if suffix else f' {stem} '
+                keys[key].add((stem, suffix))
+    automaton = ahocorasick.Automaton()
+    for key, terms in keys.items():
+        automaton.add_word(key, tuple(terms))
+    automaton.make_automaton()
+    return automaton
+
+
+def _all_terms(keyword_patterns):
+    """Return every distinct term used by keyword_patterns."""
+    return sorted({term for entries in keyword_patterns.values() for terms, _ in entries for term in terms})
+
+
+_KEYWORD_PATTERNS = _keyword_patterns(_RAW_CATEGORY_PATTERNS)
+_KEYWORD_TERMS = _all_terms(_KEYWORD_PATTERNS)
+_KEYWORD_AUTOMATON = _keyword_automaton() if ahocorasick else None
+
+_MODEL_KEYWORD_PATTERNS = _keyword_patterns(_RAW_MODEL_PATTERNS)
+_MODEL_KEYWORD_TERMS = _all_terms(_MODEL_KEYWORD_PATTERNS)
+
+# Bit k of an issue's category mask is set when _CATEGORY_NAMES[k] matched
+_CATEGORY_BITS = {category: 1 << index for index, category in enumerate(_CATEGORY_NAMES)}
+
+_ANDROID_RE = re.compile(r'\bandroid\b')
+_IOS_RE = re.compile(r'\bios\b|\biphone\b')
+_ANDROID_WORDS = frozenset(['android'])
+_IOS_WORDS = frozenset(['ios', 'iphone'])
+
+
+# Issue files are small, so loading is dominated by open/read latency; a
+# thread pool overlaps it across files.
+_LOAD_WORKERS = 16
+
+
+# The only issue fields the analysis reads; the rest of the GitHub payload
+# (users, reactions, URLs, ...) is dropped after parsing.
+_ISSUE_FIELDS = ('number', 'title', 'body', 'state', 'labels', 'html_url')
+
+
+def _parse_bug_issue(data):
+    """Parse one issue's JSON, returning a slimmed issue only if it has the 'bug' label."""
+    payload = orjson.loads(data) if orjson else json.loads(data)
+    
+    # Check if issue has 'bug' label, stopping at the first match
+    labels = payload.get('labels', ())
+    if any(label['name'].lower() == 'bug' for label in labels):
+        issue = {field: payload.get(field) for field in _ISSUE_FIELDS}
+        
+        # Lowercased text shared by all the analyzers. Label names repeat
+        # across thousands of issues, so they are interned.
+        title = payload.get('title', '')
+        body = payload.get('body') or ''
+        issue['_text_lower'] = f"{title} {body}".lower()
+        issue['_labels_lower'] = [sys.intern(label['name'].lower()) for label in labels]
+        issue['_tokens'] = frozenset(_WORD_RE.findall(issue['_text_lower']))
+        return issue
+    return None
+
+
+def _load_bug_issue(issue_file):
+    """Load one issue file, returning (issue, failed).
+    
+    issue is None unless the file has the 'bug' label; failed is True if the
+    file could not be read or parsed.
+    """
+    try:
+        with open(issue_file, 'rb') as f:
+            return _parse_bug_issue(f.read()), False
+    except Exception as e:
+        print(f"Error loading {issue_file}: {e}")
+        return None, True
+
+
+def _read_bug_issues(issues_dir):
+    """Parse bug issues from issues.ndjson, or from the issue_*.json files.
+    
+    Returns (bug_issues, failed), where failed is True if any issue could not
+    be parsed.
+    """
     bug_issues = []
+    failed = False
+    
+    ndjson_file = issues_dir / 'issues.ndjson'
+    if ndjson_file.exists():
+        with open(ndjson_file, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    issue = _parse_bug_issue(line)
+                except Exception as e:
+                    print(f"Error loading {ndjson_file} line {line_number}: {e}")
+                    failed = True
+                    continue
+                if issue is not None:
+                    bug_issues.append(issue)
+    else:
+        issue_files = list(issues_dir.glob("issue_*.json"))
+        with ThreadPoolExecutor(max_workers=_LOAD_WORKERS) as executor:
+            for issue, issue_failed in executor.map(_load_bug_issue, issue_files):
+                failed |= issue_failed
+                if issue is not None:
+                    bug_issues.append(issue)
+    
+    return bug_issues, failed
+
+
+# Parsed bug issues (with their precomputed lowercase fields) are pickled next
+# to the issue files. The cache starts with a manifest describing the source
+# files and is only used while that manifest still matches. Bump
+# _CACHE_VERSION whenever the cached issue fields change. Nothing is cached
+# while any issue fails to parse, so its error keeps being reported.
+_CACHE_FILE = '.bugs.cache.pkl'
+_CACHE_VERSION = 4
+
+
+def _cache_manifest(issues_dir):
+    """Describe the issue files on disk, so a stale cache can be detected."""
+    ndjson_file = issues_dir / 'issues.ndjson'
+    if ndjson_file.exists():
+        stat = ndjson_file.stat()
+        return (_CACHE_VERSION, 'ndjson', stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+    
+    # Every file is listed, so replacing one with an older or same-size copy
+    # still changes the manifest; ctime catches copies that keep their mtime.
+    files = []
+    for issue_file in issues_dir.glob("issue_*.json"):
+        stat = issue_file.stat()
+        files.append((issue_file.name, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns))
+    return (_CACHE_VERSION, 'per-file', sorted(files))
+
+
+def _read_cache(cache_file, manifest):
+    """Return the cached bug issues, or None if the cache is missing or stale."""
+    try:
+        with open(cache_file, 'rb') as f:
+            if pickle.load(f) != manifest:
+                return None
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _write_cache(cache_file, manifest, bug_issues):
+    """Pickle the manifest followed by the bug issues."""
+    try:
+        with open(cache_file, 'wb') as f:
+            pickle.dump(manifest, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(bug_issues, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"Warning: could not write cache {cache_file}: {e}")
+
+
+def load_bug_issues(issues_dir, use_cache=True):
+    """Load only issues with 'bug' label.
+    
+    Reads issues.ndjson if fetch_issues.py wrote one (--format ndjson),
+    otherwise the individual issue_*.json files. Unless use_cache is False,
+    the result is cached in issues_dir and reused while the files are
+    unchanged.
+    """
     issues_dir = Path(issues_dir)
     
     print("Loading bug issues...")
     
-    for issue_file in issues_dir.glob("issue_*.json"):
-        try:
-            with open(issue_file, 'r', encoding='utf-8') as f:
-                issue = json.load(f)
-                
-                # Check if issue has 'bug' label
-                labels = [label['name'].lower() for label in issue.get('labels', [])]
-                if 'bug' in labels:
-                    bug_issues.append(issue)
-        except Exception as e:
-            print(f"Error loading {issue_file}: {e}")
+    cache_file = issues_dir / _CACHE_FILE
+    manifest = _cache_manifest(issues_dir)
+    
+    bug_issues = _read_cache(cache_file, manifest) if use_cache else None
+    if bug_issues is None:
+        bug_issues, failed = _read_bug_issues(issues_dir)
+        if use_cache and not failed:
+            _write_cache(cache_file, manifest, bug_issues)
     
     print(f"Found {len(bug_issues)} bug issues")
     return bug_issues
 
 
+def _terms_in_text(text):
+    """Return the category terms found in text, via one Aho-Corasick pass."""
+    padded = f" {_NON_WORD_RE.sub(' ', text)} "
+    seen = set()
+    for end, terms in _KEYWORD_AUTOMATON.iter(padded):
+        for term in terms:
+            # \w+ needs at least one more word character after the stem
+            if term[1] == r'\w+' and padded[end + 1] == ' ':
+                continue
+            seen.add(term)
+    return seen
+
+
+def _terms_in_tokens(tokens, terms):
+    """Return the terms present in a set of words."""
+    sorted_tokens = None
+    seen = set()
+    for term in terms:
+        stem, suffix = term
+        if not suffix:
+            if stem in tokens:
+                seen.add(term)
+            continue
+        
+        # Prefix terms: the first word sorting at or after the stem is the
+        # only candidate (skipping the stem itself when \w+ needs more)
+        if sorted_tokens is None:
+            sorted_tokens = sorted(tokens)
+        index = bisect_left(sorted_tokens, stem)
+        if suffix == r'\w+' and index < len(sorted_tokens) and sorted_tokens[index] == stem:
+            index += 1
+        if index < len(sorted_tokens) and sorted_tokens[index].startswith(stem):
+            seen.add(term)
+    return seen
+
+
+def _match_keywords(text, seen, keyword_patterns):
+    """Return the keys of keyword_patterns with a pattern satisfied by the seen terms."""
+    hits = set()
+    for category, entries in keyword_patterns.items():
+        for terms, confirm_re in entries:
+            if all(term in seen for term in terms) and (confirm_re is None or confirm_re.search(text)):
+                hits.add(category)
+                break
+    return hits
+
+
+def match_categories(text, tokens=None):
+    """Return the set of categories whose patterns match text.
+    
+    tokens, if given, is the set of words in text (issue['_tokens']);
+    otherwise it is computed when needed.
+    """
+    if _KEYWORD_AUTOMATON is not None:
+        return _match_keywords(text, _terms_in_text(text), _KEYWORD_PATTERNS)
+    if tokens is None:
+        tokens = frozenset(_WORD_RE.findall(text))
+    return _match_keywords(text, _terms_in_tokens(tokens, _KEYWORD_TERMS), _KEYWORD_PATTERNS)
+
+
+def category_mask(text, tokens=None):
+    """Return the category bitmask for text (see _CATEGORY_BITS)."""
+    mask = 0
+    for category in match_categories(text, tokens):
+        mask |= _CATEGORY_BITS[category]
+    return mask
+
+
+def _bucket_kernel_py(masks, n_categories):
+    """Group indices by mask bit, returned as CSR offsets and indices."""
+    # First pass counts each category's hits, second pass fills them in
+    counts = np.zeros(n_categories + 1, np.int64)
+    for i in range(masks.shape[0]):
+        for k in range(n_categories):
+            if (masks[i] >> k) & 1:
+                counts[k + 1] += 1
+    offsets = np.cumsum(counts)
+    fill = offsets[:-1].copy()
+    indices = np.empty(offsets[-1], np.int64)
+    for i in range(masks.shape[0]):
+        for k in range(n_categories):
+            if (masks[i] >> k) & 1:
+                indices[fill[k]] = i
+                fill[k] += 1
+    return offsets, indices
+
+
+# Importing Numba and loading the cached kernel costs ~0.3 s, while the kernel
+# was not measurably faster than the NumPy path up to 10M masks. So Numba is
+# only imported, lazily, for inputs at least this large.
+_NUMBA_MIN_MASKS = 10_000_000
+_bucket_kernel = None
+
+
+def _numba_bucket_kernel():
+    """Return the JIT-compiled _bucket_kernel_py, or None without Numba."""
+    global _bucket_kernel
+    if _bucket_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _bucket_kernel = False
+        else:
+            _bucket_kernel = njit(cache=True)(_bucket_kernel_py)
+    return _bucket_kernel or None
+
+
+def bucket_by_mask(masks, n_categories):
+    """Return, for each bit below n_categories, the indices of the masks that have it set.
+    
+    Used for category and hardware-model masks. Runs as vectorized NumPy
+    (or a Numba kernel for very large inputs) when available, else in plain
+    Python.
+    """
+    kernel = _numba_bucket_kernel() if np is not None and len(masks) >= _NUMBA_MIN_MASKS else None
+    if kernel:
+        offsets, indices = kernel(np.array(masks, dtype=np.uint32), n_categories)
+        return [indices[offsets[k]:offsets[k + 1]].tolist() for k in range(n_categories)]
+    
+    if np is not None:
+        mask_array = np.array(masks, dtype=np.uint32)
+        return [np.flatnonzero(mask_array & (1 << k)).tolist() for k in range(n_categories)]
+    
+    buckets = [[] for _ in range(n_categories)]
+    for index, mask in enumerate(masks):
+        while mask:
+            low_bit = mask & -mask
+            buckets[low_bit.bit_length() - 1].append(index)
+            mask ^= low_bit
+    return buckets
+
+
+# Each issue is classified independently, so large corpora are split across
+# worker processes. Below this size the pool's startup cost outweighs the win.
+_PARALLEL_MIN_ISSUES = 1000
+_CLASSIFY_CHUNKSIZE = 256
+
+
+def category_masks(texts, tokens):
+    """Return category_mask() for each text, in a process pool when worthwhile."""
+    if len(texts) >= _PARALLEL_MIN_ISSUES and (os.cpu_count() or 1) > 1:
+        # Only the texts are sent: the Aho-Corasick scan never reads the word
+        # sets, and without it, unpickling them costs workers more than
+        # rebuilding them from the text.
+        with multiprocessing.Pool() as pool:
+            return pool.map(category_mask, texts, chunksize=_CLASSIFY_CHUNKSIZE)
+    return [category_mask(text, words) for text, words in zip(texts, tokens)]
+
+
 def categorize_bugs(bug_issues):
-    """Categorize bug issues by type - multiple categories per bug."""
+    """Categorize bug issues by type - multiple categories per bug.
+    
+    Like the other analyzers, returns lists of issue numbers rather than
+    issue dicts; look the issues up by number when reporting.
+    """
     categories = {
         'bluetooth_pairing': [],
         'translation_language': [],
@@ -57,96 +523,17 @@ def categorize_bugs(bug_issues):
         'other': []
     }
     
-    patterns = {
-        'bluetooth_pairing': [
-            r'\bpair\w*\b', r'\bbluetooth\b', r'\bble\b.*\bconnect\b', r'\bdisconnect\b', 
-            r'\bglasses\b.*\bpair\b', r'\bpairing\b'
-        ],
-        'translation_language': [
-            r'\btranslat\w+\b', r'\blanguage\b', r'\bwelsh\b', r'\bchinese\b', 
-            r'\benglish\b', r'\bhang\w*\b.*\btranslat\w+\b', r'\bspeech\b.*\bprocess\w*\b'
-        ],
-        'streaming_media': [
-            r'\bstream\w*\b', r'\brtmp\b', r'\blive\b.*\bstream\b', r'\bvideo\b.*\bstream\b', 
-            r'\brecord\w*\b.*\bstream\b', r'\bmedia\b.*\bstream\b'
-        ],
-        'permissions_android': [
-            r'\bpermission\w*\b', r'\bandroid\b.*\bpermission\b', r'\bmicrophone\b.*\bpermission\b', 
-            r'\blocation\b.*\bpermission\b', r'\bnotification\w*\b.*\bpermission\b'
-        ],
-        'ios_specific': [
-            r'\bios\b', r'\biphone\b', r'\bmic\b.*\bios\b', r'\bapple\b',
-            r'\bios\b.*\bfail\w*\b', r'\bios\b.*\bcrash\b'
-        ],
-        'app_crashes': [
-            r'\bcrash\w*\b', r'\bexception\b', r'\bfail\w*\b.*\bapp\b', 
-            r'\bclose\w*\b.*\bapp\b', r'\bhang\w*\b', r'\bfreez\w*\b', r'\bsoftexception\b'
-        ],
-        'ui_navigation': [
-            r'\bpage\b', r'\bnavigat\w*\b', r'\bui\b', r'\bmenu\b', 
-            r'\bbutton\b', r'\bsettings\b.*\breset\b', r'\bscreen\b.*\bblank\b'
-        ],
-        'cloud_sync': [
-            r'\bcloud\b', r'\bsync\b', r'\bserver\b', r'\bapi\b', 
-            r'\bwebsocket\b', r'\bdatabase\b', r'\bclient\b.*\bserver\b'
-        ],
-        'hardware_integration': [
-            r'\bhardware\b', r'\bsensor\w*\b', r'\bcalibrat\w*\b', 
-            r'\bfirmware\b', r'\bglasses\b.*\bstop\b'
-        ],
-        'performance': [
-            r'\bslow\b', r'\bperformance\b', r'\btimeout\b', 
-            r'\bmemory\b', r'\bbattery\b', r'\blag\w*\b', r'\bunreliable\b'
-        ],
-        'wifi_connectivity': [
-            r'\bwifi\b', r'\bhotspot\b', r'\bpassword\b.*\bwifi\b', 
-            r'\bnetwork\b.*\bconnect\b', r'\bwifi\b.*\bconnect\b'
-        ],
-        'developer_console': [
-            r'\bdev\b.*\bconsole\b', r'\bupload\b.*\bimage\b', r'\bicon\b.*\bupload\b',
-            r'\bdeveloper\b.*\bconsole\b', r'\bauth\w*\b.*\bconsole\b'
-        ],
-        'error_handling': [
-            r'\berror\b.*\bmessage\b', r'\bfeedback\b.*\bmissing\b', r'\bretry\b.*\binfinite\b',
-            r'\bwebview\b.*\berror\b', r'\berror\b.*\bhandling\b'
-        ],
-        'audio_processing': [
-            r'\baudio\b', r'\bmicrophone\b', r'\bmic\b', r'\bspeech\b', 
-            r'\bplayback\b', r'\bsound\b', r'\bvoice\b'
-        ],
-        'gallery_media': [
-            r'\bgallery\b', r'\bmedia\b.*\btransfer\b', r'\bphoto\b.*\bsync\b',
-            r'\bgallery\b.*\bsync\b', r'\bmedia\b.*\bgallery\b'
-        ],
-        'state_synchronization': [
-            r'\bstate\b.*\bsync\b', r'\bclient\b.*\bcloud\b.*\bstate\b', 
-            r'\bapp\b.*\bstate\b', r'\bboot\b.*\bscreen\b.*\bdeleted\b'
-        ],
-        'ble_communication': [
-            r'\bble\b', r'\bphoto\b.*\brequest\b', r'\back\b.*\bissue\b',
-            r'\bble\b.*\btransfer\b', r'\bble\b.*\bcrash\b'
-        ],
-        'camera_functionality': [
-            r'\bcamera\b', r'\brotation\b.*\bhardcoded\b', r'\bphoto\b.*\btaking\b',
-            r'\brecord\w*\b', r'\bcamera\b.*\brotation\b'
-        ]
-    }
+    masks = category_masks(
+        [issue['_text_lower'] for issue in bug_issues],
+        [issue['_tokens'] for issue in bug_issues]
+    )
     
-    for issue in bug_issues:
-        title = issue.get('title', '').lower()
-        body = issue.get('body', '').lower() if issue.get('body') else ''
-        text = f"{title} {body}"
-        
-        matched_categories = []
-        for category, pattern_list in patterns.items():
-            for pattern in pattern_list:
-                if re.search(pattern, text):
-                    categories[category].append(issue)
-                    matched_categories.append(category)
-                    break
-        
-        if not matched_categories:
-            categories['other'].append(issue)
+    numbers = [issue['number'] for issue in bug_issues]
+    buckets = bucket_by_mask(masks, len(_CATEGORY_NAMES))
+    for category, indices in zip(_CATEGORY_NAMES, buckets):
+        categories[category] = [numbers[index] for index in indices]
+    
+    categories['other'] = [number for number, mask in zip(numbers, masks) if not mask]
     
     return categories
 
@@ -156,22 +543,23 @@ def analyze_platforms(bug_issues):
     platforms = {'android': [], 'ios': [], 'both': [], 'unspecified': []}
     
     for issue in bug_issues:
-        title = issue.get('title', '').lower()
-        body = issue.get('body', '').lower() if issue.get('body') else ''
-        labels = [label['name'].lower() for label in issue.get('labels', [])]
-        text = f"{title} {body} {' '.join(labels)}"
+        # Both platform patterns are single words, so the text side is a
+        # lookup in the issue's word set; labels are still searched since a
+        # label name can hold several words.
+        labels = ' '.join(issue['_labels_lower'])
+        tokens = issue['_tokens']
         
-        has_android = bool(re.search(r'\bandroid\b', text))
-        has_ios = bool(re.search(r'\bios\b|\biphone\b', text))
+        has_android = bool(_ANDROID_RE.search(labels)) or not tokens.isdisjoint(_ANDROID_WORDS)
+        has_ios = bool(_IOS_RE.search(labels)) or not tokens.isdisjoint(_IOS_WORDS)
         
         if has_android and has_ios:
-            platforms['both'].append(issue)
+            platforms['both'].append(issue['number'])
         elif has_android:
-            platforms['android'].append(issue)
+            platforms['android'].append(issue['number'])
         elif has_ios:
-            platforms['ios'].append(issue)
+            platforms['ios'].append(issue['number'])
         else:
-            platforms['unspecified'].append(issue)
+            platforms['unspecified'].append(issue['number'])
     
     return platforms
 
@@ -186,32 +574,62 @@ def analyze_hardware_models(bug_issues):
         'unspecified': []
     }
     
-    model_patterns = {
-        'even_realities_g1': [r'\bg1\b', r'\beven\b.*\brealities\b', r'\bg1\b.*\bglasses\b'],
-        'mentra_live': [r'\bmentra\b.*\blive\b', r'\blive\b'],
-        'mentra_mach1': [r'\bmach\s*1\b', r'\bmentra\b.*\bmach\b'],
-        'vuzix_z100': [r'\bvuzix\b', r'\bz100\b', r'\bz\s*100\b']
-    }
-    
+    model_names = list(_MODEL_KEYWORD_PATTERNS)
+    masks = []
     for issue in bug_issues:
-        title = issue.get('title', '').lower()
-        body = issue.get('body', '').lower() if issue.get('body') else ''
-        text = f"{title} {body}"
-        
-        matched_models = []
-        for model, pattern_list in model_patterns.items():
-            for pattern in pattern_list:
-                if re.search(pattern, text):
-                    models[model].append(issue)
-                    matched_models.append(model)
-                    break
-        
-        if not matched_models:
-            models['unspecified'].append(issue)
+        seen = _terms_in_tokens(issue['_tokens'], _MODEL_KEYWORD_TERMS)
+        matched_models = _match_keywords(issue['_text_lower'], seen, _MODEL_KEYWORD_PATTERNS)
+        masks.append(sum(1 << index for index, model in enumerate(model_names) if model in matched_models))
+    
+    numbers = [issue['number'] for issue in bug_issues]
+    buckets = bucket_by_mask(masks, len(model_names))
+    for model, indices in zip(model_names, buckets):
+        models[model] = [numbers[index] for index in indices]
+    
+    models['unspecified'] = [number for number, mask in zip(numbers, masks) if not mask]
     
     return models
 
 
+# Map categories to testing feasibility (ordered by restrictiveness)
+_TESTABILITY_HIERARCHY = {
+    'environment_dependent_hard_to_test': 4,
+    'manual_workflow_testing_needed': 3,
+    'device_matrix_testing_needed': 2,
+    'automated_tests_could_catch': 1
+}
+
+_TESTABILITY_MAP = {
+    'bluetooth_pairing': 'device_matrix_testing_needed',
+    'translation_language': 'manual_workflow_testing_needed', 
+    'streaming_media': 'environment_dependent_hard_to_test',
+    'permissions_android': 'device_matrix_testing_needed',
+    'ios_specific': 'device_matrix_testing_needed',
+    'app_crashes': 'automated_tests_could_catch',
+    'ui_navigation': 'automated_tests_could_catch',
+    'cloud_sync': 'automated_tests_could_catch',
+    'hardware_integration': 'environment_dependent_hard_to_test',
+    'performance': 'environment_dependent_hard_to_test',
+    'wifi_connectivity': 'environment_dependent_hard_to_test',
+    'developer_console': 'automated_tests_could_catch',
+    'error_handling': 'automated_tests_could_catch',
+    'audio_processing': 'device_matrix_testing_needed',
+    'gallery_media': 'manual_workflow_testing_needed',
+    'state_synchronization': 'automated_tests_could_catch',
+    'ble_communication': 'device_matrix_testing_needed',
+    'camera_functionality': 'device_matrix_testing_needed'
+}
+
+# Priorities map 1:1 to testing types, so bugs are ranked by plain integers
+# and the winning priority is decoded back to its testing type at the end.
+_CATEGORY_PRIORITY = {
+    category: _TESTABILITY_HIERARCHY[testing_type]
+    for category, testing_type in _TESTABILITY_MAP.items()
+}
+_PRIORITY_TO_TESTING_TYPE = {priority: testing_type for testing_type, priority in _TESTABILITY_HIERARCHY.items()}
+_DEFAULT_PRIORITY = _TESTABILITY_HIERARCHY['manual_workflow_testing_needed']
+
+
 def analyze_testability(categories, bug_issues):
     """Determine what testing approaches would catch these bugs - no double counting."""
     testing_types = {
@@ -221,60 +639,28 @@ def analyze_testability(categories, bug_issues):
         'environment_dependent_hard_to_test': []
     }
     
-    # Map categories to testing feasibility (ordered by restrictiveness)
-    testability_hierarchy = {
-        'environment_dependent_hard_to_test': 4,
-        'manual_workflow_testing_needed': 3,
-        'device_matrix_testing_needed': 2,
-        'automated_tests_could_catch': 1
-    }
-    
-    testability_map = {
-        'bluetooth_pairing': 'device_matrix_testing_needed',
-        'translation_language': 'manual_workflow_testing_needed', 
-        'streaming_media': 'environment_dependent_hard_to_test',
-        'permissions_android': 'device_matrix_testing_needed',
-        'ios_specific': 'device_matrix_testing_needed',
-        'app_crashes': 'automated_tests_could_catch',
-        'ui_navigation': 'automated_tests_could_catch',
-        'cloud_sync': 'automated_tests_could_catch',
-        'hardware_integration': 'environment_dependent_hard_to_test',
-        'performance': 'environment_dependent_hard_to_test',
-        'wifi_connectivity': 'environment_dependent_hard_to_test',
-        'developer_console': 'automated_tests_could_catch',
-        'error_handling': 'automated_tests_could_catch',
-        'audio_processing': 'device_matrix_testing_needed',
-        'gallery_media': 'manual_workflow_testing_needed',
-        'state_synchronization': 'automated_tests_could_catch',
-        'ble_communication': 'device_matrix_testing_needed',
-        'camera_functionality': 'device_matrix_testing_needed'
-    }
-    
     # Track each bug's most restrictive testing requirement
-    bug_testing_requirements = {}
+    bug_priorities = {}
     
     for category, issues in categories.items():
         if category == 'other':
             continue
             
-        testing_type = testability_map.get(category, 'manual_workflow_testing_needed')
-        for issue in issues:
-            issue_id = issue['number']
-            
+        priority = _CATEGORY_PRIORITY.get(category, _DEFAULT_PRIORITY)
+        for issue_id in issues:
             # If we haven't seen this bug or this requirement is more restrictive
-            if (issue_id not in bug_testing_requirements or 
-                testability_hierarchy[testing_type] > testability_hierarchy[bug_testing_requirements[issue_id]]):
-                bug_testing_requirements[issue_id] = testing_type
+            if priority > bug_priorities.get(issue_id, 0):
+                bug_priorities[issue_id] = priority
     
     # Assign each bug to its most restrictive category
     for issue in bug_issues:
         issue_id = issue['number']
-        if issue_id in bug_testing_requirements:
-            testing_type = bug_testing_requirements[issue_id]
-            testing_types[testing_type].append(issue)
+        if issue_id in bug_priorities:
+            testing_type = _PRIORITY_TO_TESTING_TYPE[bug_priorities[issue_id]]
+            testing_types[testing_type].append(issue_id)
         else:
             # Bugs not categorized go to manual workflow testing
-            testing_types['manual_workflow_testing_needed'].append(issue)
+            testing_types['manual_workflow_testing_needed'].append(issue_id)
     
     return testing_types
 
@@ -292,6 +678,8 @@ def main():
     platforms = analyze_platforms(bug_issues)
     hardware_models = analyze_hardware_models(bug_issues)
     testability = analyze_testability(categories, bug_issues)
+    issues_by_id = {i['number']: i for i in bug_issues}
+    open_ids = {i['number'] for i in bug_issues if i['state'] == 'open'}
     
     # Generate report
     print("\n" + "="*60)
@@ -299,8 +687,8 @@ def main():
     print("="*60)
     
     print(f"\nTOTAL BUG ISSUES: {len(bug_issues)}")
-    open_bugs = len([i for i in bug_issues if i['state'] == 'open'])
-    closed_bugs = len([i for i in bug_issues if i['state'] == 'closed'])
+    states = Counter(i['state'] for i in bug_issues)
+    open_bugs, closed_bugs = states['open'], states['closed']
     print(f"OPEN: {open_bugs} | CLOSED: {closed_bugs}")
     
     print(f"\nBUG CATEGORIES:")
@@ -333,11 +721,12 @@ def main():
     
     print(f"\nTOP OPEN BUGS BY CATEGORY:")
     for category, issues in categories.items():
-        open_issues = [i for i in issues if i['state'] == 'open']
+        # Only the first three open issues are shown, so stop filtering there
+        open_issues = list(islice((num for num in issues if num in open_ids), 3))
         if open_issues:
             print(f"\n{category.replace('_', ' ').title()} (Open Issues):")
-            for i, issue in enumerate(open_issues[:3]):
-                print(f"  {i+1}. #{issue['number']}: {issue['title']}")
+            for i, num in enumerate(open_issues):
+                print(f"  {i+1}. #{num}: {issues_by_id[num]['title']}")
     
     print(f"\n" + "="*60)
     print("KEY INSIGHTS FOR TESTING STRATEGY")
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Matcher consistency check for analyze_bugs.py
+Checks the keyword scans used for categories and hardware models against a
+plain re.search() of every raw pattern, on random texts built from the
+pattern terms.
+"""
+
+import argparse
+import random
+import re
+import sys
+
+import analyze_bugs as ab
+
+
+# Texts mix the pattern stems with near misses: stems with a suffix or a
+# prefix glued on, digits, underscores and non-ASCII word characters, split
+# by assorted separators and newlines.
+_SEPARATORS = [' ', ' ', ' ', '  ', '\n', '.', ', ', '-', '/', '(', ')', "'", '!']
+_AFFIXES = ['', '', '', 's', 'ing', 'ed', '_', '1', 'x', 'é']
+
+
+def _vocabulary():
+    """Return the words random texts are built from."""
+    words = set()
+    for raw_patterns in (ab._RAW_CATEGORY_PATTERNS, ab._RAW_MODEL_PATTERNS):
+        for pattern_list in raw_patterns.values():
+            for pattern in pattern_list:
+                words.update(re.findall(r'[a-z0-9]+', pattern.replace(r'\b', ' ').replace(r'\w', ' ').replace(r'\s', ' ')))
+    words.update(['the', 'app', 'is', 'not', 'a', 'z', '100', 'é', '_'])
+    return sorted(words)
+
+
+def _random_text(rng, vocabulary):
+    """Build one random text from vocabulary."""
+    parts = []
+    for _ in range(rng.randint(0, 12)):
+        word = rng.choice(vocabulary)
+        if rng.random() < 0.3:
+            word = rng.choice(_AFFIXES) + word + rng.choice(_AFFIXES)
+        parts.append(word)
+        parts.append(rng.choice(_SEPARATORS))
+    return ''.join(parts)
+
+
+def _reference(text, raw_patterns):
+    """Return the keys of raw_patterns with any pattern found by re.search()."""
+    return {key for key, pattern_list in raw_patterns.items()
+            if any(re.search(pattern, text) for pattern in pattern_list)}
+
+
+def check(count, seed):
+    """Compare every matcher with the reference on count texts; return the mismatch count."""
+    rng = random.Random(seed)
+    vocabulary = _vocabulary()
+    mismatches = 0
+    
+    for _ in range(count):
+        text = _random_text(rng, vocabulary)
+        tokens = frozenset(ab._WORD_RE.findall(text))
+        
+        expected_categories = _reference(text, ab._RAW_CATEGORY_PATTERNS)
+        results = {
+            'word set categories': ab._match_keywords(
+                text, ab._terms_in_tokens(tokens, ab._KEYWORD_TERMS), ab._KEYWORD_PATTERNS),
+            'word set models': ab._match_keywords(
+                text, ab._terms_in_tokens(tokens, ab._MODEL_KEYWORD_TERMS), ab._MODEL_KEYWORD_PATTERNS),
+            'match_categories': ab.match_categories(text, tokens),
+        }
+        expected = {
+            'word set categories': expected_categories,
+            'word set models': _reference(text, ab._RAW_MODEL_PATTERNS),
+            'match_categories': expected_categories,
+        }
+        if ab._KEYWORD_AUTOMATON is not None:
+            results['Aho-Corasick categories'] = ab._match_keywords(
+                text, ab._terms_in_text(text), ab._KEYWORD_PATTERNS)
+            expected['Aho-Corasick categories'] = expected_categories
+        
+        for matcher, result in results.items():
+            if result != expected[matcher]:
+                mismatches += 1
+                print(f"Mismatch in {matcher} for {text!r}:")
+                print(f"  expected {sorted(expected[matcher])}")
+                print(f"  got      {sorted(result)}")
+    
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Check the analyze_bugs.py keyword matchers against plain regex search'
+    )
+    parser.add_argument('-n', '--count', type=int, default=20000,
+                       help='Number of random texts (default: 20000)')
+    parser.add_argument('--seed', type=int, default=0,
+                       help='Random seed (default: 0)')
+    
+    args = parser.parse_args()
+    
+    if ab._KEYWORD_AUTOMATON is None:
+        print("pyahocorasick not installed; skipping the Aho-Corasick matcher")
+    
+    mismatches = check(args.count, args.seed)
+    if mismatches:
+        print(f"❌ {mismatches} mismatches in {args.count} texts")
+        sys.exit(1)
+    print(f"✅ All matchers agree on {args.count} texts")
+
+
+if __name__ == '__main__':
+    main()
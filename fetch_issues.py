@@ -8,10 +8,47 @@ import argparse
 import json
 import os
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 import requests
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(filepath, data, pretty=False):
+    """Write data to filepath as compact UTF-8 JSON, or indented if pretty."""
+    if orjson:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            if pretty:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            else:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
+
+def write_ndjson(filepath, records):
+    """Write records to filepath as newline-delimited JSON, one record per line."""
+    with open(filepath, 'wb') as f:
+        for record in records:
+            if orjson:
+                f.write(orjson.dumps(record))
+            else:
+                f.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+            f.write(b'\n')
+
+
+# Issue pages after the first are fetched concurrently over the shared session
+_PAGE_WORKERS = 8
+
 
 class GitHubFetcher:
     def __init__(self, token=None):
@@ -22,45 +59,63 @@ class GitHubFetcher:
         }
         if self.token:
             self.headers['Authorization'] = f'Bearer {self.token}'
+        
+        # One session keeps TCP/TLS connections alive across API calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
     
     def fetch_issues(self, owner, repo, state='all'):
-        """Fetch all issues (open and closed) from a repository."""
+        """Fetch all issues (open and closed) from a repository.
+        
+        Page 1 is fetched first; its Link header gives the last page number,
+        and the remaining pages are then fetched concurrently. The first failed
+        page cancels the pages still queued.
+        """
         issues = []
-        page = 1
         
         print(f"Fetching {state} issues from {owner}/{repo}...")
         
-        while True:
-            url = f'https://api.github.com/repos/{owner}/{repo}/issues'
-            params = {
-                'state': state,
-                'per_page': 100,
-                'page': page,
-                'sort': 'created',
-                'direction': 'desc',
-                'labels': ''  # Include all labels
-            }
-            
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            if response.status_code != 200:
-                print(f"Error fetching issues: {response.status_code}")
-                print(response.json())
-                break
-            
-            data = response.json()
-            if not data:
-                break
-            
-            # Filter out pull requests (they show up in issues endpoint)
-            page_issues = [item for item in data if 'pull_request' not in item]
-            issues.extend(page_issues)
-            
-            print(f"  Fetched page {page}: {len(page_issues)} issues")
-            page += 1
+        url = f'https://api.github.com/repos/{owner}/{repo}/issues'
+        params = {
+            'state': state,
+            'per_page': 100,
+            'sort': 'created',
+            'direction': 'desc',
+            'labels': ''  # Include all labels
+        }
+        
+        def fetch_page(page):
+            return self.session.get(url, params={**params, 'page': page})
+        
+        first_response = fetch_page(1)
+        last_url = first_response.links.get('last', {}).get('url')
+        last_page = int(parse_qs(urlparse(last_url).query)['page'][0]) if last_url else 1
+        
+        with ThreadPoolExecutor(max_workers=_PAGE_WORKERS) as executor:
+            futures = [executor.submit(fetch_page, page) for page in range(2, last_page + 1)]
+            later_responses = (future.result() for future in futures)
             
-            if len(data) < 100:
-                break
+            try:
+                for page, response in enumerate(chain([first_response], later_responses), 1):
+                    if response.status_code != 200:
+                        print(f"Error fetching issues: {response.status_code}")
+                        print(response.json())
+                        break
+                    
+                    data = response.json()
+                    if not data:
+                        break
+                    
+                    # Filter out pull requests (they show up in issues endpoint)
+                    page_issues = [item for item in data if 'pull_request' not in item]
+                    issues.extend(page_issues)
+                    
+                    print(f"  Fetched page {page}: {len(page_issues)} issues")
+            finally:
+                # However the loop ends (error page, empty page or a raised
+                # request error), don't spend more requests or rate limit on
+                # the pages still queued
+                executor.shutdown(wait=False, cancel_futures=True)
         
         return issues
     
@@ -126,10 +181,9 @@ class GitHubFetcher:
                 'cursor': cursor
             }
             
-            response = requests.post(
+            response = self.session.post(
                 url,
-                json={'query': query, 'variables': variables},
-                headers=self.headers
+                json={'query': query, 'variables': variables}
             )
             
             if response.status_code != 200:
@@ -159,8 +213,13 @@ class GitHubFetcher:
         
         return discussions
     
-    def save_to_files(self, owner, repo, issues, discussions, output_dir):
-        """Save issues and discussions to organized files."""
+    def save_to_files(self, owner, repo, issues, discussions, output_dir, file_format='per-file', pretty=False):
+        """Save issues and discussions to organized files.
+        
+        file_format is 'per-file' (one JSON file per issue/discussion) or
+        'ndjson' (a single issues.ndjson / discussions.ndjson per directory).
+        JSON files are written compact unless pretty is set.
+        """
         base_dir = Path(output_dir) / f"{owner}_{repo}"
         base_dir.mkdir(parents=True, exist_ok=True)
         
@@ -170,17 +229,26 @@ class GitHubFetcher:
         
         print(f"\nSaving {len(issues)} issues to {issues_dir}...")
         
-        for issue in issues:
-            filename = f"issue_{issue['number']}.json"
-            filepath = issues_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(issue, f, indent=2, ensure_ascii=False)
+        # Leave previously fetched issue data alone when no issues were
+        # fetched (e.g. --discussions-only)
+        if issues:
+            if file_format == 'ndjson':
+                write_ndjson(issues_dir / 'issues.ndjson', issues)
+            else:
+                for issue in issues:
+                    filename = f"issue_{issue['number']}.json"
+                    filepath = issues_dir / filename
+                    write_json(filepath, issue, pretty)
+                
+                # analyze_bugs.py prefers issues.ndjson, so drop any stale one
+                (issues_dir / 'issues.ndjson').unlink(missing_ok=True)
         
         # Save issues summary
+        issue_states = Counter(i['state'] for i in issues)
         issues_summary = {
             'total_count': len(issues),
-            'open_count': len([i for i in issues if i['state'] == 'open']),
-            'closed_count': len([i for i in issues if i['state'] == 'closed']),
+            'open_count': issue_states['open'],
+            'closed_count': issue_states['closed'],
             'fetched_at': datetime.now().isoformat(),
             'issues': [{
                 'number': i['number'],
@@ -191,8 +259,10 @@ class GitHubFetcher:
             } for i in issues]
         }
         
-        with open(issues_dir / 'summary.json', 'w', encoding='utf-8') as f:
-            json.dump(issues_summary, f, indent=2, ensure_ascii=False)
+        write_json(issues_dir / 'summary.json', issues_summary, pretty)
+        
+        # Discussions are keyed by their boolean 'closed' flag
+        discussion_states = Counter(bool(d['closed']) for d in discussions)
         
         # Save discussions
         if discussions:
@@ -201,17 +271,22 @@ class GitHubFetcher:
             
             print(f"Saving {len(discussions)} discussions to {discussions_dir}...")
             
-            for discussion in discussions:
-                filename = f"discussion_{discussion['number']}.json"
-                filepath = discussions_dir / filename
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(discussion, f, indent=2, ensure_ascii=False)
+            if file_format == 'ndjson':
+                write_ndjson(discussions_dir / 'discussions.ndjson', discussions)
+            else:
+                for discussion in discussions:
+                    filename = f"discussion_{discussion['number']}.json"
+                    filepath = discussions_dir / filename
+                    write_json(filepath, discussion, pretty)
+                
+                # Drop any stale discussions.ndjson from an earlier ndjson save
+                (discussions_dir / 'discussions.ndjson').unlink(missing_ok=True)
             
             # Save discussions summary
             discussions_summary = {
                 'total_count': len(discussions),
-                'open_count': len([d for d in discussions if not d['closed']]),
-                'closed_count': len([d for d in discussions if d['closed']]),
+                'open_count': discussion_states[False],
+                'closed_count': discussion_states[True],
                 'fetched_at': datetime.now().isoformat(),
                 'discussions': [{
                     'number': d['number'],
@@ -222,8 +297,7 @@ class GitHubFetcher:
                 } for d in discussions]
             }
             
-            with open(discussions_dir / 'summary.json', 'w', encoding='utf-8') as f:
-                json.dump(discussions_summary, f, indent=2, ensure_ascii=False)
+            write_json(discussions_dir / 'summary.json', discussions_summary, pretty)
         
         # Save combined summary
         combined_summary = {
@@ -231,18 +305,17 @@ class GitHubFetcher:
             'fetched_at': datetime.now().isoformat(),
             'issues': {
                 'total': len(issues),
-                'open': len([i for i in issues if i['state'] == 'open']),
-                'closed': len([i for i in issues if i['state'] == 'closed'])
+                'open': issue_states['open'],
+                'closed': issue_states['closed']
             },
             'discussions': {
                 'total': len(discussions),
-                'open': len([d for d in discussions if not d['closed']]),
-                'closed': len([d for d in discussions if d['closed']])
+                'open': discussion_states[False],
+                'closed': discussion_states[True]
             }
         }
         
-        with open(base_dir / 'summary.json', 'w', encoding='utf-8') as f:
-            json.dump(combined_summary, f, indent=2, ensure_ascii=False)
+        write_json(base_dir / 'summary.json', combined_summary, pretty)
         
         print(f"\n✅ Data saved to: {base_dir}")
         print(f"   Issues: {combined_summary['issues']['total']} ({combined_summary['issues']['open']} open, {combined_summary['issues']['closed']} closed)")
@@ -259,6 +332,8 @@ Examples:
   %(prog)s microsoft/vscode -o ./data
   %(prog)s owner/repo --token ghp_your_token_here
   %(prog)s owner/repo --issues-only
+  %(prog)s owner/repo --format ndjson
+  %(prog)s owner/repo --pretty
 
 Environment Variables:
   GITHUB_TOKEN    GitHub personal access token (recommended for higher rate limits)
@@ -273,6 +348,11 @@ Environment Variables:
                        help='Fetch only issues, skip discussions')
     parser.add_argument('--discussions-only', action='store_true',
                        help='Fetch only discussions, skip issues')
+    parser.add_argument('--format', choices=['per-file', 'ndjson'], default='per-file',
+                       help='On-disk layout: one JSON file per item, or a single '
+                            'newline-delimited JSON file (default: per-file)')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent JSON files for reading (default: compact)')
     
     args = parser.parse_args()
     
@@ -303,7 +383,7 @@ Environment Variables:
     
     # Save to files
     if issues or discussions:
-        fetcher.save_to_files(owner, repo, issues, discussions, args.output)
+        fetcher.save_to_files(owner, repo, issues, discussions, args.output, args.format, args.pretty)
     else:
         print("No data fetched.")
         sys.exit(1)